@@ -1,24 +1,40 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session, g
+from flask import Flask, Response, render_template, stream_template, get_flashed_messages, request, redirect, url_for, flash, session, g, before_render_template, abort
 from flask_babel import Babel, gettext as _, lazy_gettext as _l
 from helpers import (
     # Auth functions
     login, logout, login_required, is_authenticated,
     # Post management
-    load_posts, save_posts,
+    load_posts, load_all_posts, save_posts, utc_timestamp,
     # Project management
     load_all_projects, get_project,
     # Pricing management
-    load_pricing_data, get_pricing_tiers, get_contact_info
+    load_pricing_data,
+    # JSON API
+    API_DEFAULT_LIMIT, API_MAX_LIMIT, API_POST_DEFAULT_FIELDS, API_PROJECT_DEFAULT_FIELDS,
+    API_POST_FIELDS, API_PROJECT_FIELDS,
+    post_sort_key, project_sort_key, serialize_post, serialize_project, parse_fields,
+    paginate_by_cursor,
+    # Markdown rendering
+    render_markdown,
+    # Critical CSS
+    SITE_STYLESHEETS, EXTERNAL_STYLESHEETS, get_critical_css,
+    # Preload hints
+    PRECONNECT_ORIGINS, get_asset_manifest, template_references, first_content_image,
+    preload_link, preconnect_link,
+    # Sitemap and feeds
+    SITEMAP_MAX_URLS, SITEMAP_PAGES, sitemap_urls, build_sitemap, build_sitemap_index,
+    build_atom_feed, build_rss_feed, cached_document,
+    # Page views
+    ViewCounter,
+    # Streamed rendering
+    coalesce_chunks
 )
-from datetime import datetime
-import markdown
-import re
+import json
 import os
 import uuid
 from urllib.parse import quote_plus
 from werkzeug.utils import secure_filename
 from dotenv import load_dotenv
-from jinja2 import TemplateNotFound
 
 # Load environment variables from .env file
 load_dotenv()
@@ -45,6 +61,19 @@ app.config['UPLOAD_FOLDER'] = os.path.join(_FRONTEND_DIR, 'static', 'uploads')
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload
 app.config['ALLOWED_EXTENSIONS'] = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
 
+# Number of posts rendered server-side on /blog before "Load more" kicks in
+BLOG_PAGE_SIZE = 12
+
+# Page views are counted in memory and flushed to content/views.json in batches
+app.config['TRACK_VIEWS'] = os.environ.get('TRACK_VIEWS', '1') != '0'
+view_counter = ViewCounter()
+
+# Canonical origin for sitemap and feed URLs
+app.config['SITE_URL'] = os.environ.get('SITE_URL', 'https://adrianagropan.com').rstrip('/')
+
+# Listing and post pages are streamed so <head> reaches the browser before the body renders
+app.config['STREAM_TEMPLATES'] = os.environ.get('STREAM_TEMPLATES', '1') != '0'
+
 # Configure Babel for internationalization
 def get_locale():
     '''Determine the user's preferred language - TEMPORARILY ENGLISH ONLY'''
@@ -86,19 +115,8 @@ app.config['LANGUAGES'] = {
 # Custom Jinja filter for markdown processing
 @app.template_filter('md')
 def md_filter(text):
-    if not text:
-        return ""
-    # Process markdown
-    md_html = markdown.markdown(
-        text,
-        extensions=['markdown.extensions.fenced_code', 'markdown.extensions.tables', 'markdown.extensions.nl2br']
-    )
-    # Replace double line breaks with paragraphs for better spacing
-    md_html = re.sub(r'<br />\s*<br />', '</p><p>', md_html)
-    # Wrap content in paragraphs if not already
-    if not md_html.startswith('<'):
-        md_html = f'<p>{md_html}</p>'
-    return md_html
+    # Highlighting happens server-side and the HTML is cached per source text
+    return render_markdown(text)
 
 def allowed_file(filename):
     """Check if the uploaded file has an allowed extension"""
@@ -137,8 +155,103 @@ def inject_conf_var():
     '''Make configuration variables available to all templates'''
     return dict(
         LANGUAGES=app.config['LANGUAGES'],
-        current_lang=g.get('current_lang', 'en')
+        current_lang=g.get('current_lang', 'en'),
+        SITE_STYLESHEETS=SITE_STYLESHEETS,
+        EXTERNAL_STYLESHEETS=EXTERNAL_STYLESHEETS
+    )
+
+@before_render_template.connect_via(app)
+def inject_critical_css(sender, template, context, **extra):
+    '''Give base.html the critical CSS generated for the template being rendered'''
+    context.setdefault('critical_css', get_critical_css(template.name))
+
+# Template each HTML endpoint renders, so its preload hints are known before the view runs
+ENDPOINT_TEMPLATES = {
+    'index': 'index.html',
+    'blog': 'blog.html',
+    'about': 'about.html',
+    'contact': 'contact.html',
+    'post': 'post.html',
+    'create': 'create_post.html',
+    'edit': 'edit_post.html',
+    'login_page': 'login.html',
+    'projects_index': 'projects/index.html',
+    'project_detail': 'projects/detail.html',
+    'pricing': 'pricing.html'
+}
+
+@app.before_request
+def send_preload_hints():
+    '''Work out the endpoint's critical assets and send them as 103 Early Hints before the view runs'''
+    template_name = ENDPOINT_TEMPLATES.get(request.endpoint)
+    if template_name is None:
+        return
+    links = [preconnect_link(origin) for origin in PRECONNECT_ORIGINS]
+    for href, as_type in get_asset_manifest(template_name):
+        url = href if '://' in href else url_for('static', filename=href)
+        links.append(preload_link(url, as_type))
+    g.preload_links = links
+    
+    # Only on servers that expose Early Hints to WSGI apps
+    send_early_hints = request.environ.get('wsgi.early_hints')
+    if callable(send_early_hints) and request.method == 'GET':
+        send_early_hints([('Link', link) for link in links])
+
+@before_render_template.connect_via(app)
+def collect_content_preloads(sender, template, context, **extra):
+    '''Add the first image the page's content shows; only known once the view has loaded it'''
+    if 'preload_images' in g:
+        return  # nested render, the page's own template came first
+    images = []
+    post = context.get('post')
+    if post is not None and template_references(template.name, 'content_html'):
+        images.append(first_content_image(post.content))
+    if template_references(template.name, 'hero_image'):
+        for name in ('project', 'featured_project'):
+            project = context.get(name)
+            if project:
+                images.append(project.hero_image)
+    g.preload_images = [url for url in dict.fromkeys(images) if url]
+
+@app.after_request
+def add_preload_links(response):
+    '''Let the browser fetch critical assets while the HTML is still arriving'''
+    links = g.get('preload_links', []) + [preload_link(url, 'image') for url in g.get('preload_images', [])]
+    if links and response.status_code == 200 and response.mimetype == 'text/html':
+        response.headers['Link'] = ', '.join(links)
+    return response
+
+def record_view(kind, ident):
+    '''Count a page view (memory only, flushed in the background)'''
+    if app.config['TRACK_VIEWS'] and request.method == 'GET':
+        view_counter.record(kind, ident)
+
+def popular_posts(posts, limit=3):
+    '''Most read posts from the in-memory ranking, no I/O'''
+    if not app.config['TRACK_VIEWS']:
+        return []
+    by_id = {str(p.id): p for p in posts}
+    ranked = [by_id[ident] for ident, _views in view_counter.popular('post', limit * 2) if ident in by_id]
+    return ranked[:limit]
+
+def render_page(template_name_or_list, **context):
+    '''
+    render_template, or a chunked streamed response when STREAM_TEMPLATES is on.
+    Load content before calling this: once streaming starts the status is sent,
+    so errors can no longer become a proper error page.
+    '''
+    if not app.config['STREAM_TEMPLATES']:
+        return render_template(template_name_or_list, **context)
+    # Session changes made while streaming are never saved, so pop flashes up front;
+    # base.html gets the same messages back from the request context
+    get_flashed_messages(with_categories=True)
+    response = Response(
+        coalesce_chunks(stream_template(template_name_or_list, **context)),
+        mimetype='text/html'
     )
+    # Ask nginx-style proxies not to buffer; gzip in front of us still compresses per chunk
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
 
 @app.template_filter('reject_lang')
 def reject_lang_filter(view_args):
@@ -156,22 +269,19 @@ def index(lang='en'):
     
     # Get featured project
     featured_project = next(
-        (p for p in projects if p.get('featured')), 
+        (p for p in projects if p.featured), 
         projects[0] if projects else None
     )
     
     # Sort posts by date, newest first
-    posts_sorted = sorted(
-        posts, 
-        key=lambda x: x.get('created_at', ''), 
-        reverse=True
-    )
+    posts_sorted = sorted(posts, key=post_sort_key, reverse=True)
     
-    return render_template(
+    return render_page(
         'index.html', 
         posts=posts_sorted,
         projects=projects,
-        featured_project=featured_project
+        featured_project=featured_project,
+        popular_posts=popular_posts(posts)
     )
 
 @app.route('/blog')
@@ -180,21 +290,16 @@ def blog(lang='en'):
     """Dedicated blog page - all posts"""
     posts = load_posts()
     
-    # Normalize posts to ensure consistent field names
-    for post in posts:
-        # Use 'date' if available, otherwise fall back to 'created_at'
-        if 'date' in post and not post.get('created_at'):
-            post['created_at'] = post['date']
-        elif not post.get('created_at') and not post.get('date'):
-            post['created_at'] = '2026-01-22'  # Default date
-    
-    # Sort posts by date, newest first
-    posts_sorted = sorted(
-        posts, 
-        key=lambda x: x.get('created_at', ''), 
-        reverse=True
-    )
-    return render_template('blog.html', posts=posts_sorted)
+    # One page per request; ?cursor= comes from the "Load more" link, which
+    # main.js turns into /api/posts fetches
+    try:
+        posts_page, next_cursor = paginate_by_cursor(
+            posts, post_sort_key, cursor=request.args.get('cursor'),
+            limit=BLOG_PAGE_SIZE, reverse=True
+        )
+    except ValueError:
+        abort(400)
+    return render_page('blog.html', posts=posts_page, next_cursor=next_cursor, page_size=BLOG_PAGE_SIZE)
 
 @app.route('/about')
 @app.route('/<lang>/about')
@@ -204,16 +309,13 @@ def about(lang='en'):
     projects = load_all_projects()
     
     # Get 3 most recent posts for sidebar
-    recent_posts = sorted(
-        posts, 
-        key=lambda x: x.get('created_at', ''), 
-        reverse=True
-    )[:3] if posts else []
+    recent_posts = sorted(posts, key=post_sort_key, reverse=True)[:3]
     
     return render_template(
         'about.html', 
         recent_posts=recent_posts, 
-        projects=projects
+        projects=projects,
+        popular_posts=popular_posts(posts)
     )
 
 @app.route('/contact')
@@ -225,15 +327,16 @@ def contact(lang='en'):
 def post(id):
     """Individual blog post page"""
     posts = load_posts()
-    post = next((p for p in posts if str(p['id']) == str(id)), None)
+    post = next((p for p in posts if str(p.id) == str(id)), None)
     if post is None:
         return "<h1>Post not found</h1>", 404
     
-    # Convert markdown content to HTML
-    if 'content' in post:
-        post['content_html'] = markdown.markdown(post['content'])
+    record_view('post', post.id)
     
-    return render_template('post.html', post=post)
+    # post.content_html is rendered once per content and cached, code already highlighted;
+    # render it before streaming so a failure is still a 500, not a cut-off page
+    post.content_html
+    return render_page('post.html', post=post)
 
 
 @app.route('/create', methods=['GET', 'POST'])
@@ -253,9 +356,10 @@ def create():
                 image_md = f"\n\n![{title}]({image_path})\n\n"
                 content += image_md
         
-        posts = load_posts()
+        posts = load_all_posts()
         new_id = max([post['id'] for post in posts], default=0) + 1
-        created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        # Content times are UTC; sitemap lastmod and feed dates are published as such
+        created_at = utc_timestamp()
         posts.append({
             'id': new_id,
             'title': title,
@@ -272,7 +376,7 @@ def create():
 @login_required
 def edit(id):
     """Edit existing blog post (admin only)"""
-    posts = load_posts()
+    posts = load_all_posts()
     post = next((p for p in posts if str(p['id']) == str(id)), None) 
     if not post:
         return "<h1>Post not found</h1>", 404
@@ -301,7 +405,7 @@ def edit(id):
 @login_required
 def delete(id):
     """Delete blog post (admin only)"""
-    posts = load_posts()
+    posts = load_all_posts()
     posts = [p for p in posts if str(p['id']) != str(id)]
     save_posts(posts)
     flash('Post deleted successfully!', 'success')
@@ -343,7 +447,7 @@ def logout_page():
 def projects_index(lang='en'):
     """Projects listing page"""
     projects = load_all_projects()
-    return render_template('projects/index.html', projects=projects)
+    return render_page('projects/index.html', projects=projects)
 
 @app.route('/projects/<project_name>')
 @app.route('/<lang>/projects/<project_name>')
@@ -353,12 +457,10 @@ def project_detail(project_name, lang='en'):
     if not project:
         return "<h1>Project not found</h1>", 404
     
-    try:
-        # Try to render specific project template first
-        return render_template(f"projects/{project_name}.html", project=project)
-    except TemplateNotFound:
-        # Fall back to generic project detail template
-        return render_template("projects/detail.html", project=project)
+    record_view('project', project.slug)
+    
+    # Specific project template first, generic detail template as fallback
+    return render_page([f"projects/{project_name}.html", "projects/detail.html"], project=project)
 
 
 @app.route('/pricing')
@@ -368,6 +470,124 @@ def pricing(lang='en'):
     pricing_data = load_pricing_data()
     return render_template('pricing.html', pricing_data=pricing_data)
 
+# =============================================================================
+# READ-ONLY JSON API
+# =============================================================================
+
+def api_response(payload, status=200):
+    """Compact JSON response with an ETag so clients can revalidate with 304s"""
+    body = json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+    response = Response(body, status=status, mimetype='application/json')
+    if status == 200:
+        response.add_etag()
+        response.cache_control.public = True
+        response.cache_control.max_age = 60
+        response.make_conditional(request)
+    return response
+
+def api_page(items, key, serialize, default_fields, allowed_fields, reverse=False):
+    """Apply ?cursor=, ?limit= and ?fields= to a list of models, serializing only the requested fields of the page"""
+    limit = request.args.get('limit', API_DEFAULT_LIMIT, type=int)
+    limit = max(1, min(limit, API_MAX_LIMIT))
+    try:
+        fields = parse_fields(request.args.get('fields'), default_fields, allowed_fields)
+    except ValueError as e:
+        return api_response({'error': str(e)}, status=400)
+    
+    try:
+        page, next_cursor = paginate_by_cursor(
+            items, key, cursor=request.args.get('cursor'), limit=limit, reverse=reverse
+        )
+    except ValueError:
+        return api_response({'error': 'Invalid cursor'}, status=400)
+    
+    return api_response({
+        'items': [serialize(item, fields) for item in page],
+        'next_cursor': next_cursor
+    })
+
+@app.route('/api/posts')
+def api_posts():
+    """Published posts, newest first"""
+    return api_page(
+        load_posts(), post_sort_key, serialize_post,
+        API_POST_DEFAULT_FIELDS, API_POST_FIELDS, reverse=True
+    )
+
+@app.route('/api/projects')
+def api_projects():
+    """All projects, ordered by slug"""
+    return api_page(
+        load_all_projects(), project_sort_key, serialize_project,
+        API_PROJECT_DEFAULT_FIELDS, API_PROJECT_FIELDS
+    )
+
+# =============================================================================
+# SITEMAP AND FEEDS
+# =============================================================================
+
+def xml_response(name, sources, build, mimetype):
+    """Serve a cached generated document with ETag/Last-Modified so crawlers get 304s"""
+    body, etag, last_modified = cached_document(name, sources, build)
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
+def absolute_url(endpoint, **values):
+    '''Canonical URL on SITE_URL; the request Host header is client-controlled'''
+    return app.config['SITE_URL'] + url_for(endpoint, **values)
+
+def all_sitemap_urls(posts, projects):
+    return sitemap_urls(posts, projects, absolute_url)
+
+@app.route('/sitemap.xml')
+def sitemap():
+    """Sitemap, or a sitemap index once there are more than SITEMAP_MAX_URLS pages"""
+    posts, projects = load_posts(), load_all_projects()
+    
+    def build():
+        urls = all_sitemap_urls(posts, projects)
+        if len(urls) <= SITEMAP_MAX_URLS:
+            return build_sitemap(urls)
+        return build_sitemap_index(urls, lambda page: absolute_url('sitemap_page', page=page))
+    
+    return xml_response('sitemap.xml', (posts, projects), build, 'application/xml')
+
+@app.route('/sitemap-<int:page>.xml')
+def sitemap_page(page):
+    """One chunk of a split sitemap"""
+    posts, projects = load_posts(), load_all_projects()
+    
+    def build():
+        urls = all_sitemap_urls(posts, projects)
+        start = (page - 1) * SITEMAP_MAX_URLS
+        return build_sitemap(urls[start:start + SITEMAP_MAX_URLS])
+    
+    total_urls = len(SITEMAP_PAGES) + len(posts) + len(projects)
+    if page < 1 or (page - 1) * SITEMAP_MAX_URLS >= total_urls:
+        abort(404)
+    return xml_response(f'sitemap-{page}.xml', (posts, projects), build, 'application/xml')
+
+@app.route('/feed.atom')
+def atom_feed():
+    """Atom feed of the latest case studies"""
+    posts = load_posts()
+    build = lambda: build_atom_feed(
+        posts, absolute_url('atom_feed'), absolute_url('index'), lambda p: absolute_url('post', id=p.id)
+    )
+    return xml_response('feed.atom', (posts,), build, 'application/atom+xml')
+
+@app.route('/feed.rss')
+def rss_feed():
+    """RSS 2.0 feed of the latest case studies"""
+    posts = load_posts()
+    build = lambda: build_rss_feed(posts, absolute_url('index'), lambda p: absolute_url('post', id=p.id))
+    return xml_response('feed.rss', (posts,), build, 'application/rss+xml')
+
 # Add this route for debugging static files during development
 @app.route('/debug/static')
 def debug_static():
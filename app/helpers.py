@@ -3,11 +3,35 @@ Consolidated helpers module - Contains all utility functions previously scattere
 This merges: auth.py, post_manager.py, project_manager.py, and pricing_manager.py
 """
 
+import atexit
+import base64
+import binascii
+import collections
+import contextlib
+import hashlib
+import heapq
 import json
 import os
+import re
 import functools
+import stat
+import tempfile
+import threading
+import time
+import markdown
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
 from flask import session, redirect, url_for, flash, request
-from typing import List, Dict, Optional
+from markupsafe import Markup
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: view counter files aren't locked
+    fcntl = None
 
 # =============================================================================
 # AUTH FUNCTIONALITY (from utils/auth.py)
@@ -39,10 +63,397 @@ def login_required(view):
     def wrapped_view(*args, **kwargs):
         if not is_authenticated():
             flash('Please log in to access this page.', 'error')
-            return redirect(url_for('login', next=request.path))
+            return redirect(url_for('login_page', next=request.path))
         return view(*args, **kwargs)
     return wrapped_view
 
+# =============================================================================
+# CONTENT MODELS
+# =============================================================================
+
+class ContentError(ValueError):
+    """Raised when an entry in content/*.json doesn't match the expected schema"""
+
+
+class ContentModel:
+    """
+    Base for read-only content records. Subclasses list their fields in
+    __slots__, so instances carry no per-object __dict__.
+    """
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields.get(name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__[:2])
+        return f"{type(self).__name__}({fields})"
+
+    def __getitem__(self, name):
+        # Lets templates keep using post['id'] style lookups
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def get(self, name, default=None):
+        """dict.get() equivalent for callers that treat records as mappings"""
+        value = getattr(self, name, None)
+        return default if value is None else value
+
+    def to_dict(self):
+        """Plain JSON-serializable representation"""
+        return {name: _to_plain(getattr(self, name)) for name in self.__slots__}
+
+
+def _to_plain(value):
+    """Convert models, tuples and nested dicts back into JSON types."""
+    if isinstance(value, ContentModel):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    return value
+
+
+class _EntryReader:
+    """Typed field access on one raw JSON entry, with errors naming the entry"""
+
+    def __init__(self, entry, where, allowed):
+        if not isinstance(entry, dict):
+            raise ContentError(f"{where}: expected an object, got {type(entry).__name__}")
+        unknown = set(entry) - set(allowed)
+        if unknown:
+            raise ContentError(f"{where}: unknown field(s) {', '.join(sorted(unknown))}")
+        self.entry = entry
+        self.where = where
+
+    def field(self, name, kind, required=False, default=None):
+        value = self.entry.get(name)
+        if value is None:
+            if required:
+                raise ContentError(f"{self.where}: missing required field '{name}'")
+            return default
+        if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+            expected = kind.__name__ if isinstance(kind, type) else ' or '.join(k.__name__ for k in kind)
+            raise ContentError(f"{self.where}: field '{name}' must be {expected}, got {value!r}")
+        return value
+
+    def string_list(self, name):
+        values = self.field(name, list, default=[])
+        for value in values:
+            if not isinstance(value, str):
+                raise ContentError(f"{self.where}: field '{name}' must contain strings, got {value!r}")
+        return tuple(values)
+
+
+_POST_DATE_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d')
+
+def normalize_post_date(value):
+    """
+    Normalize a post date to 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS'.
+    
+    Raises:
+        ValueError: If the value isn't a recognised date
+    """
+    value = str(value).strip()
+    for fmt in _POST_DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        return parsed.strftime('%Y-%m-%d') if fmt == '%Y-%m-%d' else parsed.strftime('%Y-%m-%d %H:%M:%S')
+    raise ValueError(f"unrecognised date {value!r}")
+
+def _optional_date(value):
+    return normalize_post_date(value) if value else None
+
+
+class Post(ContentModel):
+    """A blog post / case study"""
+    __slots__ = ('id', 'title', 'content', 'date', 'updated_at', 'category', 'tags', 'published', 'source')
+
+    FIELDS = ('id', 'title', 'content', 'date', 'created_at', 'updated_at', 'category', 'tags', 'published', 'source')
+
+    @classmethod
+    def from_dict(cls, entry, where):
+        reader = _EntryReader(entry, where, cls.FIELDS)
+        # Older posts use 'created_at' (from the /create form), newer ones 'date'
+        raw_date = reader.entry.get('date') or reader.entry.get('created_at')
+        if not raw_date:
+            raise ContentError(f"{where}: missing required field 'date'")
+        try:
+            date = normalize_post_date(raw_date)
+            updated_at = _optional_date(reader.field('updated_at', str))
+        except ValueError as e:
+            raise ContentError(f"{where}: {e}") from None
+        return cls(
+            id=reader.field('id', int, required=True),
+            title=reader.field('title', str, required=True),
+            content=reader.field('content', str, default=''),
+            date=date,
+            updated_at=updated_at,
+            category=reader.field('category', str, default=''),
+            tags=reader.string_list('tags'),
+            published=reader.field('published', bool, default=True),
+            source=reader.field('source', str)
+        )
+
+    @property
+    def day(self):
+        """Date without the time part, for listings"""
+        return self.date.split(' ')[0]
+
+    @property
+    def lastmod(self):
+        """Last modification time, falling back to the publication date"""
+        return self.updated_at or self.date
+
+    @property
+    def content_html(self):
+        """Rendered markdown (cached by render_markdown)"""
+        return render_markdown(self.content)
+
+    @property
+    def excerpt(self):
+        return post_excerpt(self.content)
+
+
+class ProjectPerformance(ContentModel):
+    __slots__ = ('rows_tested', 'processing_time', 'speed')
+
+    @classmethod
+    def from_dict(cls, entry, where):
+        reader = _EntryReader(entry, where, cls.__slots__)
+        return cls(**{name: reader.field(name, str, default='') for name in cls.__slots__})
+
+
+class ProjectPriceTier(ContentModel):
+    __slots__ = ('rows', 'price')
+
+    @classmethod
+    def from_dict(cls, entry, where):
+        reader = _EntryReader(entry, where, cls.__slots__)
+        return cls(rows=reader.field('rows', str, required=True), price=reader.field('price', str, required=True))
+
+
+class Project(ContentModel):
+    """A portfolio project from projects.json"""
+    __slots__ = (
+        'slug', 'title', 'tagline', 'summary', 'category', 'status', 'tags',
+        'technologies', 'featured', 'hero_image', 'github_url', 'demo_url',
+        'features', 'performance', 'use_cases', 'pricing', 'updated_at'
+    )
+
+    _TEXT_FIELDS = ('tagline', 'summary', 'category', 'status', 'hero_image', 'github_url', 'demo_url')
+
+    @classmethod
+    def from_dict(cls, entry, where):
+        reader = _EntryReader(entry, where, cls.__slots__)
+        performance = reader.field('performance', dict)
+        pricing = reader.field('pricing', dict, default={})
+        try:
+            updated_at = _optional_date(reader.field('updated_at', str))
+        except ValueError as e:
+            raise ContentError(f"{where}: {e}") from None
+        return cls(
+            slug=reader.field('slug', str, required=True),
+            updated_at=updated_at,
+            title=reader.field('title', str, required=True),
+            tags=reader.string_list('tags'),
+            technologies=reader.string_list('technologies'),
+            featured=reader.field('featured', bool, default=False),
+            features=reader.string_list('features'),
+            use_cases=reader.string_list('use_cases'),
+            performance=ProjectPerformance.from_dict(performance, f"{where}.performance") if performance else None,
+            pricing={tier: ProjectPriceTier.from_dict(value, f"{where}.pricing.{tier}")
+                     for tier, value in pricing.items()},
+            **{name: reader.field(name, str) for name in cls._TEXT_FIELDS}
+        )
+
+
+class Service(ContentModel):
+    __slots__ = ('title', 'description', 'features', 'starting_price', 'delivery_time', 'color')
+
+    @classmethod
+    def from_dict(cls, entry, where):
+        reader = _EntryReader(entry, where, cls.__slots__)
+        return cls(
+            title=reader.field('title', str, required=True),
+            description=reader.field('description', str, default=''),
+            features=reader.string_list('features'),
+            starting_price=reader.field('starting_price', (int, float)),
+            delivery_time=reader.field('delivery_time', str, default=''),
+            color=reader.field('color', str, default='')
+        )
+
+
+class PricingPackage(ContentModel):
+    """A data cleaning or workflow automation package"""
+    __slots__ = ('name', 'subtitle', 'price', 'rows', 'complexity', 'features', 'popular', 'note')
+
+    @classmethod
+    def from_dict(cls, entry, where):
+        reader = _EntryReader(entry, where, cls.__slots__)
+        return cls(
+            name=reader.field('name', str, required=True),
+            price=reader.field('price', (int, float), required=True),
+            features=reader.string_list('features'),
+            popular=reader.field('popular', bool, default=False),
+            **{name: reader.field(name, str) for name in ('subtitle', 'rows', 'complexity', 'note')}
+        )
+
+
+class SelfServiceOffer(ContentModel):
+    __slots__ = ('title', 'subtitle', 'price', 'note')
+
+    @classmethod
+    def from_dict(cls, entry, where):
+        reader = _EntryReader(entry, where, cls.__slots__)
+        return cls(
+            title=reader.field('title', str, required=True),
+            subtitle=reader.field('subtitle', str, default=''),
+            price=reader.field('price', (int, float), required=True),
+            note=reader.field('note', str, default='')
+        )
+
+
+class UseCase(ContentModel):
+    __slots__ = ('department', 'tasks')
+
+    @classmethod
+    def from_dict(cls, entry, where):
+        reader = _EntryReader(entry, where, cls.__slots__)
+        return cls(department=reader.field('department', str, required=True), tasks=reader.field('tasks', str, default=''))
+
+
+class ContactInfo(ContentModel):
+    __slots__ = ('email', 'response_time', 'github')
+
+    @classmethod
+    def from_dict(cls, entry, where):
+        reader = _EntryReader(entry, where, cls.__slots__)
+        return cls(**{name: reader.field(name, str, default='') for name in cls.__slots__})
+
+
+class DemoInfo(ContentModel):
+    __slots__ = ('sample_file', 'rows', 'duplicates_percent', 'date_formats', 'blank_rows_percent', 'processing_time')
+
+    @classmethod
+    def from_dict(cls, entry, where):
+        reader = _EntryReader(entry, where, cls.__slots__)
+        return cls(
+            sample_file=reader.field('sample_file', str, default=''),
+            processing_time=reader.field('processing_time', str, default=''),
+            **{name: reader.field(name, int, default=0)
+               for name in ('rows', 'duplicates_percent', 'date_formats', 'blank_rows_percent')}
+        )
+
+
+class PricingData(ContentModel):
+    """All sections of pricing.json"""
+    __slots__ = (
+        'services', 'data_cleaning_packages', 'workflow_automation_packages', 'self_service',
+        'performance_metrics', 'use_cases', 'contact', 'process_steps', 'demo'
+    )
+
+    @classmethod
+    def from_dict(cls, entry, where):
+        reader = _EntryReader(entry, where, cls.__slots__)
+
+        def mapping(name, model):
+            return {key: model.from_dict(value, f"{where}.{name}.{key}")
+                    for key, value in reader.field(name, dict, default={}).items()}
+
+        def section(name, model):
+            value = reader.field(name, dict)
+            return model.from_dict(value, f"{where}.{name}") if value is not None else None
+
+        use_cases = reader.field('use_cases', list, default=[])
+        metrics = reader.field('performance_metrics', dict, default={})
+        return cls(
+            services=mapping('services', Service),
+            data_cleaning_packages=mapping('data_cleaning_packages', PricingPackage),
+            workflow_automation_packages=mapping('workflow_automation_packages', PricingPackage),
+            self_service=section('self_service', SelfServiceOffer),
+            performance_metrics={key: str(value) for key, value in metrics.items()},
+            use_cases=tuple(UseCase.from_dict(value, f"{where}.use_cases[{i}]") for i, value in enumerate(use_cases)),
+            contact=section('contact', ContactInfo),
+            process_steps=reader.string_list('process_steps'),
+            demo=section('demo', DemoInfo)
+        )
+
+
+def _entry_label(path, index, entry, key):
+    """Human readable location of a list entry, e.g. posts.json[3] (id=4)"""
+    label = f"{os.path.basename(path)}[{index}]"
+    if isinstance(entry, dict) and entry.get(key) is not None:
+        label += f" ({key}={entry[key]})"
+    return label
+
+def build_models(path, entries, model, key):
+    """
+    Validate a list of raw entries into models.
+    
+    Raises:
+        ContentError: On the first invalid entry, naming the file and index
+    """
+    if not isinstance(entries, list):
+        raise ContentError(f"{os.path.basename(path)}: expected a list of entries")
+    return tuple(
+        model.from_dict(entry, _entry_label(path, index, entry, key))
+        for index, entry in enumerate(entries)
+    )
+
+# Parsed content keyed by path, reused until the file's mtime or size changes
+_content_cache = {}
+
+def _load_cached(path, build):
+    """Return build(path), rebuilding only when the file has changed on disk."""
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _content_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    value = build(path)
+    _content_cache[path] = (stamp, value)
+    return value
+
+def _read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def utc_timestamp():
+    """Current time as stored in content files: 'YYYY-MM-DD HH:MM:SS', always UTC."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+def stamp_updated_entries(path, entries, key):
+    """
+    Set 'updated_at' on entries that are new or differ from what's on disk,
+    so sitemaps and feeds get accurate lastmod times for touched entries only.
+    """
+    try:
+        previous = {e.get(key): e for e in _read_json(path) if isinstance(e, dict)}
+    except (FileNotFoundError, json.JSONDecodeError):
+        previous = {}
+    
+    now = utc_timestamp()
+    for entry in entries:
+        old = previous.get(entry.get(key))
+        unchanged = old is not None and (
+            {k: v for k, v in old.items() if k != 'updated_at'} ==
+            {k: v for k, v in entry.items() if k != 'updated_at'}
+        )
+        if not unchanged:
+            entry['updated_at'] = now
+        elif old.get('updated_at') and not entry.get('updated_at'):
+            entry['updated_at'] = old['updated_at']
+
 # =============================================================================
 # POST MANAGEMENT (from utils/post_manager.py)
 # =============================================================================
@@ -52,19 +463,46 @@ _APP_DIR = os.path.dirname(__file__)  # /path/to/app/
 _PROJECT_ROOT = os.path.dirname(_APP_DIR)  # /path/to/PyArch.dev/
 POSTS_FILE = os.path.join(_PROJECT_ROOT, 'content', 'posts.json')
 
-def load_posts():
-    """Load blog posts from JSON file, filtering out unpublished posts"""
-    with open(POSTS_FILE, 'r') as f:
-        all_posts = json.load(f)
-    
+def _atomic_write_json(path, data):
+    """Write JSON to a temp file next to path, then swap it in with os.replace"""
+    directory = os.path.dirname(path)
+    # mkstemp creates 0600 files; keep the mode readers of the old file rely on
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.json')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def load_all_posts():
+    """Load every blog post as raw dicts, including unpublished ones (for editing)"""
+    return _read_json(POSTS_FILE)
+
+def _build_published_posts(path):
+    posts = build_models(path, _read_json(path), Post, 'id')
     # Filter out unpublished posts for public display
-    published_posts = [post for post in all_posts if post.get('published', True)]
-    return published_posts
+    return tuple(post for post in posts if post.published)
+
+def load_posts():
+    """Load published posts as validated Post models (cached until posts.json changes)"""
+    return _load_cached(POSTS_FILE, _build_published_posts)
     
 def save_posts(posts):
-    """Save blog posts to JSON file"""
-    with open(POSTS_FILE, "w") as f:
-        json.dump(posts, f, indent=4)
+    """Validate and save blog posts (raw dicts) to the JSON file"""
+    build_models(POSTS_FILE, posts, Post, 'id')
+    stamp_updated_entries(POSTS_FILE, posts, 'id')
+    _atomic_write_json(POSTS_FILE, posts)
 
 # =============================================================================
 # PROJECT MANAGEMENT (from utils/project_manager.py)
@@ -79,28 +517,32 @@ def _ensure_projects_file():
         with open(PROJECTS_FILE, 'w') as f:
             json.dump([], f)
 
-def load_projects() -> List[Dict]:
-    """Load projects from the JSON file."""
+def _build_projects(path):
+    try:
+        entries = _read_json(path)
+    except json.JSONDecodeError:
+        return ()
+    return build_models(path, entries, Project, 'slug')
+
+def load_projects() -> Tuple['Project', ...]:
+    """Load projects as validated Project models (cached until projects.json changes)."""
     _ensure_projects_file()
-    with open(PROJECTS_FILE, 'r') as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError:
-            return []
+    return _load_cached(PROJECTS_FILE, _build_projects)
 
 # Alias for compatibility with existing imports
 load_all_projects = load_projects
 
 def save_projects(projects: List[Dict]) -> None:
-    """Persist projects to the JSON file."""
+    """Validate and persist projects (raw dicts) to the JSON file."""
     _ensure_projects_file()
-    with open(PROJECTS_FILE, 'w') as f:
-        json.dump(projects, f, indent=4)
+    build_models(PROJECTS_FILE, projects, Project, 'slug')
+    stamp_updated_entries(PROJECTS_FILE, projects, 'slug')
+    _atomic_write_json(PROJECTS_FILE, projects)
 
-def get_project(slug: str) -> Optional[Dict]:
+def get_project(slug: str) -> Optional['Project']:
     """Get a single project by its slug/name."""
     projects = load_projects()
-    return next((p for p in projects if p.get('slug') == slug), None)
+    return next((p for p in projects if p.slug == slug), None)
 
 # =============================================================================
 # PRICING MANAGEMENT (from utils/pricing_manager.py)
@@ -108,45 +550,1266 @@ def get_project(slug: str) -> Optional[Dict]:
 
 PRICING_FILE = os.path.join(_PROJECT_ROOT, 'content', 'pricing.json')
 
+def _build_pricing(path):
+    try:
+        entry = _read_json(path)
+    except json.JSONDecodeError:
+        entry = {}
+    return PricingData.from_dict(entry, os.path.basename(path))
+
 def load_pricing_data():
-    """Load pricing data from JSON file."""
+    """Load pricing data as a validated PricingData model (cached until the file changes)."""
     try:
-        with open(PRICING_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _load_cached(PRICING_FILE, _build_pricing)
     except FileNotFoundError:
-        return {}
-    except json.JSONDecodeError:
-        return {}
+        return PricingData.from_dict({}, os.path.basename(PRICING_FILE))
 
 def get_service_info(service_key):
-    """Get information for a specific service."""
-    pricing_data = load_pricing_data()
-    return pricing_data.get('services', {}).get(service_key, {})
+    """Get information for a specific service ({} if unknown)."""
+    return load_pricing_data().services.get(service_key, {})
 
 def get_pricing_tiers():
-    """Get all pricing tier information."""
-    pricing_data = load_pricing_data()
-    return pricing_data.get('pricing_tiers', {})
+    """
+    Get all data cleaning pricing tiers.
+    
+    pricing.json has no 'pricing_tiers' section (this used to return {}), so
+    the tiers are the data_cleaning_packages shown on the pricing page.
+    """
+    return load_pricing_data().data_cleaning_packages
 
 def get_contact_info():
     """Get contact information."""
-    pricing_data = load_pricing_data()
-    return pricing_data.get('contact', {})
+    return load_pricing_data().contact
 
 def get_demo_info():
     """Get demo information."""
-    pricing_data = load_pricing_data()
-    return pricing_data.get('demo', {})
+    return load_pricing_data().demo
 
 def get_performance_metrics():
     """Get performance metrics."""
-    pricing_data = load_pricing_data()
-    return pricing_data.get('performance_metrics', {})
+    return load_pricing_data().performance_metrics
 
 def get_use_cases():
     """Get use cases."""
-    pricing_data = load_pricing_data()
-    return pricing_data.get('use_cases', [])
+    return load_pricing_data().use_cases
+
+# =============================================================================
+# JSON API HELPERS
+# =============================================================================
+
+API_DEFAULT_LIMIT = 10
+API_MAX_LIMIT = 100
+
+# Fields returned when the client does not ask for specific ones with ?fields=
+API_POST_DEFAULT_FIELDS = ('id', 'title', 'date', 'category', 'tags', 'excerpt')
+API_PROJECT_DEFAULT_FIELDS = (
+    'slug', 'title', 'tagline', 'summary', 'category',
+    'status', 'tags', 'featured', 'hero_image'
+)
+
+def post_sort_key(post):
+    """Sort key for Post models: date first, id as a tie breaker."""
+    return (post.date, post.id)
+
+def project_sort_key(project):
+    """Sort key for Project models: alphabetical by slug."""
+    return (project.slug,)
+
+def post_excerpt(content, length=120):
+    """Plain-text teaser for a post, same rules as the blog listing card."""
+    text = (content or '').replace('<img', '').replace('![', '').replace('#', '')
+    text = Markup(text).striptags()
+    return (text[:length] + '...') if len(text) > length else text
+
+# Every field a client may ask for with ?fields=; each is computed only when requested
+_POST_API_FIELDS = {
+    'id': lambda post: post.id,
+    'title': lambda post: post.title,
+    'date': lambda post: post.date,
+    'category': lambda post: post.category,
+    'tags': lambda post: list(post.tags),
+    'excerpt': lambda post: post.excerpt,
+    'content': lambda post: post.content,
+}
+API_POST_FIELDS = tuple(_POST_API_FIELDS)
+API_PROJECT_FIELDS = Project.__slots__
+
+def serialize_post(post, fields=API_POST_FIELDS):
+    """Public representation of a Post used by the JSON API, limited to fields."""
+    return {field: _POST_API_FIELDS[field](post) for field in fields}
+
+def serialize_project(project, fields=API_PROJECT_FIELDS):
+    """Public representation of a Project used by the JSON API, limited to fields."""
+    return {field: _to_plain(getattr(project, field)) for field in fields}
+
+def parse_fields(value, default, allowed):
+    """
+    Parse a comma separated ?fields= value, falling back to default.
+    
+    Raises:
+        ValueError: If a requested field isn't in allowed
+    """
+    fields = list(dict.fromkeys(field.strip() for field in (value or '').split(',') if field.strip()))
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    return fields or list(default)
+
+def encode_cursor(key):
+    """Encode a sort key tuple into an opaque, URL-safe cursor."""
+    raw = json.dumps(list(key), separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor().
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(key, list):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return tuple(key)
+
+def paginate_by_cursor(items, key, cursor=None, limit=API_DEFAULT_LIMIT, reverse=False):
+    """
+    Keyset pagination over a sequence of content models.
+    
+    Args:
+        items (list): Items to paginate
+        key (callable): Returns a unique, JSON-serializable sort key tuple
+        cursor (str): Cursor returned by the previous page (optional)
+        limit (int): Maximum number of items per page
+        reverse (bool): Sort descending (newest first for posts)
+    
+    Returns:
+        tuple: (page items, next cursor or None)
+    """
+    ordered = sorted(items, key=key, reverse=reverse)
+    if cursor:
+        after = decode_cursor(cursor)
+        try:
+            if reverse:
+                ordered = [item for item in ordered if key(item) < after]
+            else:
+                ordered = [item for item in ordered if key(item) > after]
+        except TypeError as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+    
+    page = ordered[:limit]
+    next_cursor = encode_cursor(key(page[-1])) if len(ordered) > limit else None
+    return page, next_cursor
+
+# =============================================================================
+# MARKDOWN RENDERING
+# =============================================================================
+
+# Pygments style used for server-side code highlighting (see tools/build_highlight_css.py)
+HIGHLIGHT_STYLE = 'monokai'
+HIGHLIGHT_CSS_CLASS = 'codehilite'
+HIGHLIGHT_CSS_FILE = os.path.join(_PROJECT_ROOT, 'frontend', 'static', 'css', 'highlight.css')
+
+MARKDOWN_EXTENSIONS = [
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.codehilite',
+    'markdown.extensions.tables',
+    'markdown.extensions.nl2br'
+]
+MARKDOWN_EXTENSION_CONFIGS = {
+    'markdown.extensions.codehilite': {
+        'css_class': HIGHLIGHT_CSS_CLASS,
+        'guess_lang': False
+    }
+}
+
+@functools.lru_cache(maxsize=512)
+def render_markdown(text):
+    """
+    Convert post markdown to HTML with code blocks highlighted by Pygments.
+    
+    Results are cached by source text, so each post is compiled once per
+    worker and edits naturally miss the cache.
+    """
+    if not text:
+        return ""
+    md_html = markdown.markdown(
+        text,
+        extensions=MARKDOWN_EXTENSIONS,
+        extension_configs=MARKDOWN_EXTENSION_CONFIGS
+    )
+    # Replace double line breaks with paragraphs for better spacing
+    md_html = re.sub(r'<br />\s*<br />', '</p><p>', md_html)
+    # Wrap content in paragraphs if not already
+    if not md_html.startswith('<'):
+        md_html = f'<p>{md_html}</p>'
+    return md_html
+
+def build_highlight_css(path=HIGHLIGHT_CSS_FILE):
+    """Write the Pygments stylesheet for highlighted code blocks."""
+    from pygments.formatters import HtmlFormatter
+    selector = f'.{HIGHLIGHT_CSS_CLASS}'
+    css = HtmlFormatter(style=HIGHLIGHT_STYLE).get_style_defs(selector)
+    # Drop Pygments' global pre/line-number rules so only code blocks are affected
+    css = '\n'.join(line for line in css.splitlines() if line.startswith(selector))
+    base_rules = (
+        f"{selector} {{ border-radius: var(--radius-md, 8px); margin: 1.5rem 0; overflow-x: auto; }}\n"
+        f"{selector} pre {{ margin: 0; padding: 1rem 1.25rem; background: transparent; "
+        f"font-size: 0.875rem; line-height: 1.6; }}\n"
+    )
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"/* Generated by tools/build_highlight_css.py ({HIGHLIGHT_STYLE}) - do not edit */\n")
+        f.write(base_rules)
+        f.write(css + "\n")
+    return path
+
+# =============================================================================
+# CRITICAL CSS
+# =============================================================================
+
+_STATIC_DIR = os.path.join(_PROJECT_ROOT, 'frontend', 'static')
+_TEMPLATES_DIR = os.path.join(_PROJECT_ROOT, 'frontend', 'templates')
+CRITICAL_CSS_DIR = os.path.join(_STATIC_DIR, 'css', 'critical')
+
+# Local stylesheets shared by every page, in cascade order (relative to static/)
+SITE_STYLESHEETS = [
+    'css/style.css',
+    'css/social-icons.css',
+    'css/blog-images.css',
+    'css/enhanced-images.css',
+    'css/highlight.css',
+    'css/navigation.css'
+]
+
+# Third-party stylesheets, always loaded asynchronously
+EXTERNAL_STYLESHEETS = [
+    'https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap',
+    'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css'
+]
+
+# How much of a page's content block counts as "above the fold"
+CRITICAL_CONTENT_CHARS = 6000
+
+_JINJA_TAG_RE = re.compile(r'{%.*?%}|{{.*?}}|{#.*?#}', re.DOTALL)
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_PSEUDO_ARGS_RE = re.compile(r'\([^)]*\)')
+# States that need user interaction, so they can't affect first paint
+_INTERACTION_PSEUDO_RE = re.compile(r':(?:hover|focus|focus-visible|focus-within|active|visited)\b|::selection')
+
+def _template_source(name):
+    """Read a template from frontend/templates."""
+    with open(os.path.join(_TEMPLATES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+def above_the_fold_html(template_name):
+    """
+    Approximate the markup rendered above the fold for a template: everything
+    in base.html before the content block plus the start of the page's own
+    content block. Jinja tags are stripped, the HTML around them is kept.
+    """
+    source = _template_source(template_name)
+    parent = re.search(r'{%\s*extends\s+["\']([^"\']+)["\']\s*%}', source)
+    if not parent:
+        return _JINJA_TAG_RE.sub(' ', source[:CRITICAL_CONTENT_CHARS])
+    
+    base = _template_source(parent.group(1))
+    base_head = base.split('{% block content %}')[0]
+    content = source.split('{% block content %}', 1)[-1][:CRITICAL_CONTENT_CHARS]
+    return _JINJA_TAG_RE.sub(' ', base_head + content)
+
+def collect_html_tokens(html):
+    """Return the tag names, classes, ids and attribute names used in markup."""
+    tags = {t.lower() for t in re.findall(r'<([a-zA-Z][\w-]*)', html)}
+    attrs = {a.lower() for a in re.findall(r'\s([a-zA-Z][\w-]*)=', html)}
+    attr_values = {(a.lower(), v) for a, v in re.findall(r'\s([a-zA-Z][\w-]*)="([^"]*)"', html)}
+    classes = set()
+    for value in re.findall(r'class="([^"]*)"', html):
+        classes.update(value.split())
+    ids = set(re.findall(r'id="([^"]+)"', html))
+    # The root elements are always rendered even if they fall outside the slice
+    tags.update({'html', 'head', 'body'})
+    return {'tags': tags, 'attrs': attrs, 'attr_values': attr_values, 'classes': classes, 'ids': ids}
+
+def selector_matches(selector, tokens):
+    """
+    Check whether every class, id, attribute and tag in a selector appears in
+    the markup. Combinators and pseudo-classes are ignored, so this errs on
+    the side of including a rule. Interaction states (:hover, :focus...) never match.
+    """
+    if _INTERACTION_PSEUDO_RE.search(selector):
+        return False
+    simple = _PSEUDO_ARGS_RE.sub('', selector)
+    simple = re.sub(r'::?[\w-]+', '', simple)
+    
+    for attr, value in re.findall(r'\[\s*([\w-]+)\s*(?:=\s*["\']?([^"\'\]]*))?', simple):
+        if attr.lower() not in tokens['attrs']:
+            return False
+        # Exact [attr="value"] selectors also need the value. That drops the dark
+        # theme, which JS switches to later, when the full stylesheets have loaded.
+        if value and (attr.lower(), value) not in tokens['attr_values']:
+            return False
+    simple = re.sub(r'\[[^\]]*\]', '', simple)
+    
+    for cls in re.findall(r'\.([\w-]+)', simple):
+        if cls not in tokens['classes']:
+            return False
+    for id_ in re.findall(r'#([\w-]+)', simple):
+        if id_ not in tokens['ids']:
+            return False
+    for tag in re.findall(r'(?:^|[\s>+~])([a-zA-Z][\w-]*)', simple):
+        if tag.lower() not in tokens['tags']:
+            return False
+    return True
+
+def _matching_block_end(css, start):
+    """Index just past the '}' closing the block opened at css[start]."""
+    depth = 0
+    for i in range(start, len(css)):
+        if css[i] == '{':
+            depth += 1
+        elif css[i] == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return len(css)
+
+def extract_critical_rules(css, tokens, at_rules=None):
+    """
+    Return the subset of a stylesheet whose selectors match the tokens.
+    
+    @font-face and @keyframes blocks are appended to `at_rules` as
+    (prelude, block) pairs instead, so the caller can keep only those the
+    kept rules use. Without the list they are dropped.
+    """
+    css = _CSS_COMMENT_RE.sub('', css)
+    kept = []
+    pos = 0
+    while True:
+        brace = css.find('{', pos)
+        if brace == -1:
+            break
+        prelude = css[pos:brace].strip()
+        end = _matching_block_end(css, brace)
+        body = css[brace + 1:end - 1]
+        pos = end
+        
+        if prelude.startswith('@media print'):
+            continue
+        elif prelude.startswith(('@media', '@supports')):
+            inner = extract_critical_rules(body, tokens, at_rules)
+            if inner:
+                kept.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith(('@font-face', '@keyframes', '@-webkit-keyframes')):
+            if at_rules is not None:
+                at_rules.append((prelude, f"{prelude}{{{' '.join(body.split())}}}"))
+        elif prelude.startswith('@'):
+            continue
+        else:
+            selectors = [sel.strip() for sel in prelude.split(',') if sel.strip()]
+            matched = [sel for sel in selectors if selector_matches(sel, tokens)]
+            if matched:
+                declarations = ' '.join(body.split())
+                kept.append(f"{','.join(matched)}{{{declarations}}}")
+    return '\n'.join(kept)
+
+def used_at_rules(css, at_rules):
+    """The @keyframes named by an animation and @font-face families named by a font-family in css."""
+    animations = ' '.join(re.findall(r'animation(?:-name)?\s*:([^;}]*)', css))
+    families = ' '.join(re.findall(r'font-family\s*:([^;}]*)', css))
+    used = []
+    for prelude, block in at_rules:
+        if prelude.startswith('@font-face'):
+            family = re.search(r'font-family\s*:\s*["\']?([^"\';}]+)', block)
+            if family and family.group(1).strip() in families:
+                used.append(block)
+        else:
+            name = prelude.split(None, 1)[-1].strip()
+            if re.search(rf'(?<![\w-]){re.escape(name)}(?![\w-])', animations):
+                used.append(block)
+    return used
+
+def build_critical_css(template_name):
+    """Compute the critical CSS for one template from SITE_STYLESHEETS."""
+    tokens = collect_html_tokens(above_the_fold_html(template_name))
+    parts = []
+    at_rules = []
+    for stylesheet in SITE_STYLESHEETS:
+        with open(os.path.join(_STATIC_DIR, stylesheet), 'r', encoding='utf-8') as f:
+            rules = extract_critical_rules(f.read(), tokens, at_rules)
+        if rules:
+            parts.append(rules)
+    css = '\n'.join(parts)
+    return '\n'.join([css] + used_at_rules(css, at_rules)) if css else ''
+
+def build_all_critical_css():
+    """
+    Write critical CSS for every page template to CRITICAL_CSS_DIR.
+    
+    Returns:
+        dict: Template name -> size of the generated CSS in bytes
+    """
+    results = {}
+    for root, _dirs, files in os.walk(_TEMPLATES_DIR):
+        # Partials are included into pages, not rendered on their own
+        if os.path.relpath(root, _TEMPLATES_DIR).split(os.sep)[0] == 'partials':
+            continue
+        for filename in sorted(files):
+            if not filename.endswith('.html') or filename == 'base.html':
+                continue
+            name = os.path.relpath(os.path.join(root, filename), _TEMPLATES_DIR).replace(os.sep, '/')
+            css = build_critical_css(name)
+            out_path = os.path.join(CRITICAL_CSS_DIR, name[:-len('.html')] + '.css')
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+            with open(out_path, 'w', encoding='utf-8') as f:
+                f.write(css + '\n')
+            results[name] = len(css.encode('utf-8'))
+    return results
+
+@functools.lru_cache(maxsize=64)
+def get_critical_css(template_name):
+    """Generated critical CSS for a template, or '' if the build step hasn't run."""
+    if not template_name:
+        return ''
+    path = os.path.join(CRITICAL_CSS_DIR, template_name.rsplit('.', 1)[0] + '.css')
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return ''
+
+# =============================================================================
+# PRELOAD HINTS
+# =============================================================================
+
+# Web font CSS is render-blocking for text, so it's the one external stylesheet worth preloading
+FONT_STYLESHEET_ORIGIN = 'https://fonts.googleapis.com/'
+PRELOAD_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.svg'}
+
+# Origins the fonts stylesheet pulls font files from
+PRECONNECT_ORIGINS = ['https://fonts.gstatic.com']
+
+_TEMPLATE_DEPENDENCY_RE = re.compile(r'{%-?\s*(?:extends|include)\s+["\']([^"\']+)["\']')
+
+def template_sources(template_name, templates_dir=_TEMPLATES_DIR):
+    """Source of a template and everything it extends or includes, layouts first."""
+    sources = []
+    pending = [template_name]
+    seen = set()
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        try:
+            with open(os.path.join(templates_dir, name), 'r', encoding='utf-8') as f:
+                source = f.read()
+        except (FileNotFoundError, IsADirectoryError):
+            continue
+        sources.insert(0, (name, source))
+        pending.extend(_TEMPLATE_DEPENDENCY_RE.findall(source))
+    return sources
+
+def build_asset_manifest(template_name):
+    """
+    Assets a template needs for first render, as (href, as) pairs. Hrefs are
+    absolute URLs or filenames relative to static/.
+    
+    Only pages built on base.html get any, namely the web font stylesheet. The
+    main stylesheet is added when no critical CSS was generated; otherwise
+    the site stylesheets, icons and deferred scripts load async and preloading
+    them would only compete with the HTML.
+    """
+    if 'base.html' not in (name for name, _source in template_sources(template_name)):
+        return ()
+    manifest = [(href, 'style') for href in EXTERNAL_STYLESHEETS if href.startswith(FONT_STYLESHEET_ORIGIN)]
+    if not get_critical_css(template_name):
+        manifest.append((SITE_STYLESHEETS[0], 'style'))
+    return tuple(manifest)
+
+@functools.lru_cache(maxsize=64)
+def get_asset_manifest(template_name):
+    """Cached build_asset_manifest(); empty for templates rendered from strings."""
+    if not template_name:
+        return ()
+    return build_asset_manifest(template_name)
+
+@functools.lru_cache(maxsize=64)
+def template_references(template_name, name):
+    """Whether a template (or a layout/partial it uses) mentions `name`."""
+    if not template_name:
+        return False
+    return any(re.search(rf'\b{re.escape(name)}\b', source) for _, source in template_sources(template_name))
+
+def first_content_image(text):
+    """Earliest local image in markdown/HTML content, i.e. the likeliest LCP element."""
+    matches = [m for m in (_MD_IMAGE_RE.search(text), _HTML_IMAGE_RE.search(text)) if m]
+    if not matches:
+        return None
+    url = min(matches, key=lambda m: m.start()).group(1)
+    if not url.startswith('/') or url.startswith('//'):
+        return None
+    if os.path.splitext(_clean_url(url))[1].lower() not in PRELOAD_IMAGE_EXTENSIONS:
+        return None
+    return url
+
+def preload_link(url, as_type):
+    """One `Link` header value; fonts must be fetched in CORS mode to be reused."""
+    crossorigin = '; crossorigin' if as_type == 'font' else ''
+    return f"<{url}>; rel=preload; as={as_type}{crossorigin}"
+
+def preconnect_link(origin):
+    return f"<{origin}>; rel=preconnect; crossorigin"
+
+# =============================================================================
+# BULK MARKDOWN IMPORT
+# =============================================================================
+
+_FRONT_MATTER_RE = re.compile(r'\A(---|\+\+\+)[ \t]*\n(.*?)\n\1[ \t]*(?:\n|\Z)', re.DOTALL)
+_MD_IMAGE_RE = re.compile(r'!\[[^\]]*\]\(\s*<?([^)\s>]+)')
+_HTML_IMAGE_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
+_FRONT_MATTER_ITEM_RE = re.compile(r'\s*("[^"]*"|\'[^\']*\'|[^,]*?)\s*(?:,|$)')
+
+def _parse_front_matter_value(raw):
+    """Convert a front matter scalar or [list] into a Python value."""
+    value = raw.strip()
+    if value.startswith('[') and value.endswith(']'):
+        # Quoted items may contain commas, so split with a regex rather than str.split
+        items = _FRONT_MATTER_ITEM_RE.findall(value[1:-1])
+        return [_parse_front_matter_value(item) for item in items if item]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        return value[1:-1]
+    if value.lower() in ('true', 'yes'):
+        return True
+    if value.lower() in ('false', 'no'):
+        return False
+    if re.fullmatch(r'-?\d+', value):
+        return int(value)
+    return value
+
+def parse_front_matter(text):
+    """
+    Split a markdown document into front matter and body.
+    
+    Supports YAML-style (--- key: value ---) and TOML-style (+++ key = value +++)
+    blocks with scalar values and inline [a, b] lists. YAML blocks also accept
+    block lists ("key:" followed by "  - item" lines).
+    
+    Returns:
+        tuple: (metadata dict, markdown body)
+    
+    Raises:
+        ValueError: If a front matter line can't be parsed
+    """
+    match = _FRONT_MATTER_RE.match(text)
+    if not match:
+        return {}, text
+    
+    separator = ':' if match.group(1) == '---' else '='
+    metadata = {}
+    list_key = None  # YAML key with an empty value, which block list items attach to
+    for line_no, line in enumerate(match.group(2).splitlines(), start=2):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if separator == ':' and (stripped == '-' or stripped.startswith('- ')):
+            if list_key is None:
+                raise ValueError(f"line {line_no}: list item without a key, got {stripped!r}")
+            if not isinstance(metadata[list_key], list):
+                metadata[list_key] = []
+            metadata[list_key].append(_parse_front_matter_value(stripped[1:]))
+            continue
+        if separator not in line:
+            raise ValueError(f"line {line_no}: expected 'key{separator} value', got {stripped!r}")
+        key, value = line.split(separator, 1)
+        key = key.strip()
+        metadata[key] = _parse_front_matter_value(value)
+        list_key = key if separator == ':' and not value.strip() else None
+    return metadata, text[match.end():]
+
+def extract_image_refs(markdown_text):
+    """Return every image URL referenced by markdown or inline <img> tags."""
+    return _MD_IMAGE_RE.findall(markdown_text) + _HTML_IMAGE_RE.findall(markdown_text)
+
+def find_missing_static_refs(refs, static_folder=_STATIC_DIR):
+    """Return the /static/ references that don't exist on disk."""
+    missing = []
+    for ref in refs:
+        if not ref.startswith('/static/'):
+            continue
+        path = os.path.join(static_folder, ref[len('/static/'):].split('?')[0])
+        if not os.path.isfile(path):
+            missing.append(ref)
+    return missing
+
+def parse_markdown_post(path, source_key):
+    """
+    Parse and render one markdown file into a post record.
+    
+    Module-level so it can run in a process pool.
+    
+    Returns:
+        dict: {'source': key, 'post': dict or None, 'errors': [..], 'warnings': [..]}
+    """
+    result = {'source': source_key, 'post': None, 'errors': [], 'warnings': []}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            metadata, body = parse_front_matter(f.read())
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        result['errors'].append(str(e))
+        return result
+    
+    title = metadata.get('title')
+    if not title:
+        heading = re.search(r'^#\s+(.+)$', body, re.MULTILINE)
+        title = heading.group(1).strip() if heading else None
+    if not title:
+        result['errors'].append("missing title")
+    
+    try:
+        date = normalize_post_date(metadata.get('date', ''))
+    except ValueError as e:
+        date = None
+        result['errors'].append(f"invalid or missing date: {e}")
+    
+    tags = metadata.get('tags', [])
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in tags.split(',') if tag.strip()]
+    
+    # A quoted "false" must not publish a draft, so only real booleans are accepted
+    published = metadata.get('published', True)
+    if not isinstance(published, bool):
+        result['errors'].append(f"published must be true or false, got {published!r}")
+    
+    # Rendering here catches markdown that would break the post page
+    try:
+        render_markdown(body)
+    except Exception as e:
+        result['errors'].append(f"markdown render failed: {e}")
+    
+    for ref in find_missing_static_refs(extract_image_refs(body)):
+        result['errors'].append(f"missing image: {ref}")
+    
+    if result['errors']:
+        return result
+    
+    post = {
+        'title': title,
+        'date': date,
+        'tags': tags,
+        'category': metadata.get('category', ''),
+        'published': published,
+        'content': body.strip() + '\n',
+        'source': source_key
+    }
+    # Same checks save_posts() runs (string title/category/tags...), but reported
+    # against this file instead of failing the whole import later
+    try:
+        Post.from_dict({'id': 0, **post}, source_key)
+    except ContentError as e:
+        # The report already names the file
+        result['errors'].append(str(e).removeprefix(f"{source_key}: "))
+        return result
+    
+    result['post'] = post
+    return result
+
+def find_markdown_files(directory):
+    """Return (path, source key) pairs for every .md file under directory, sorted."""
+    found = []
+    for root, _dirs, files in os.walk(directory):
+        for filename in files:
+            if filename.endswith('.md'):
+                path = os.path.join(root, filename)
+                key = os.path.relpath(path, directory).replace(os.sep, '/')[:-len('.md')]
+                found.append((path, key))
+    return sorted(found, key=lambda item: item[1])
+
+def import_markdown_posts(directory, workers=None, dry_run=False, progress=None):
+    """
+    Import a directory tree of markdown posts in one batched write.
+    
+    Files are parsed and rendered in parallel. Each imported post remembers its
+    source path, so re-running updates existing posts instead of duplicating them.
+    Nothing is written if any file fails validation.
+    
+    Args:
+        directory (str): Root of the markdown tree
+        workers (int): Process pool size (defaults to CPU count)
+        dry_run (bool): Validate only, don't write posts.json
+        progress (callable): Called as progress(done, total) after each file
+    
+    Returns:
+        dict: Counts of created/updated/unchanged posts plus per-file errors
+    """
+    
+    files = find_markdown_files(directory)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(parse_markdown_post, path, key) for path, key in files]
+        for done, future in enumerate(as_completed(futures), start=1):
+            results.append(future.result())
+            if progress:
+                progress(done, len(files))
+    # Assign ids in path order regardless of which worker finished first
+    results.sort(key=lambda r: r['source'])
+    
+    report = {
+        'created': 0, 'updated': 0, 'unchanged': 0,
+        'errors': {r['source']: r['errors'] for r in results if r['errors']}
+    }
+    if report['errors']:
+        return report
+    
+    posts = load_all_posts()
+    by_source = {p['source']: p for p in posts if p.get('source')}
+    next_id = max((p['id'] for p in posts), default=0) + 1
+    
+    for result in results:
+        incoming = result['post']
+        existing = by_source.get(incoming['source'])
+        if existing is None:
+            posts.append({'id': next_id, **incoming})
+            next_id += 1
+            report['created'] += 1
+        elif any(existing.get(k) != v for k, v in incoming.items()):
+            existing.update(incoming)
+            report['updated'] += 1
+        else:
+            report['unchanged'] += 1
+    
+    if not dry_run and (report['created'] or report['updated']):
+        save_posts(posts)
+    return report
+
+# =============================================================================
+# SITEMAP AND FEEDS
+# =============================================================================
+
+# The sitemap protocol allows at most 50,000 URLs per file
+SITEMAP_MAX_URLS = 50000
+FEED_SIZE = 20
+FEED_TITLE = 'Adriana Gropan | Case Studies'
+FEED_AUTHOR = 'Adriana Gropan'
+
+# Listing pages in the sitemap and which content their lastmod follows
+SITEMAP_PAGES = {
+    'index': 'all',
+    'blog': 'posts',
+    'projects_index': 'projects',
+    'about': 'posts',
+    'pricing': None,
+    'contact': None
+}
+
+def _w3c_datetime(value):
+    """'YYYY-MM-DD[ HH:MM:SS]' -> W3C/RFC 3339 timestamp (content times are UTC)."""
+    if not value:
+        return None
+    if ' ' not in value:
+        return value
+    return value.replace(' ', 'T') + 'Z'
+
+def _rfc3339(value):
+    """Like _w3c_datetime but always with a time, as Atom requires."""
+    return _w3c_datetime(value if ' ' in value else f"{value} 00:00:00")
+
+def _parse_content_datetime(value):
+    fmt = '%Y-%m-%d %H:%M:%S' if ' ' in value else '%Y-%m-%d'
+    return datetime.strptime(value, fmt).replace(tzinfo=timezone.utc)
+
+def newest_lastmod(records):
+    """Most recent lastmod among posts/projects, or None."""
+    values = [r.lastmod if isinstance(r, Post) else r.updated_at for r in records]
+    values = [v for v in values if v]
+    return max(values) if values else None
+
+def sitemap_urls(posts, projects, url_for_page):
+    """
+    Every public URL with its lastmod.
+    
+    Args:
+        url_for_page (callable): Builds an absolute URL, e.g. url_for_page('post', id=1)
+    
+    Returns:
+        list: (loc, lastmod) tuples
+    """
+    lastmods = {
+        'posts': newest_lastmod(posts),
+        'projects': newest_lastmod(projects),
+        None: None
+    }
+    lastmods['all'] = max(filter(None, [lastmods['posts'], lastmods['projects']]), default=None)
+    urls = [(url_for_page(endpoint), lastmods[source]) for endpoint, source in SITEMAP_PAGES.items()]
+    urls.extend((url_for_page('post', id=p.id), p.lastmod) for p in posts)
+    urls.extend((url_for_page('project_detail', project_name=p.slug), p.updated_at) for p in projects)
+    return urls
+
+@functools.lru_cache(maxsize=SITEMAP_MAX_URLS)
+def _sitemap_url_xml(loc, lastmod):
+    """One <url> element. Cached, so only new or touched entries are rendered."""
+    if lastmod:
+        return f"<url><loc>{escape(loc)}</loc><lastmod>{_w3c_datetime(lastmod)}</lastmod></url>"
+    return f"<url><loc>{escape(loc)}</loc></url>"
+
+def build_sitemap(urls):
+    """<urlset> document for at most SITEMAP_MAX_URLS URLs."""
+    body = ''.join(_sitemap_url_xml(loc, lastmod) for loc, lastmod in urls)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        f'{body}</urlset>\n'
+    )
+
+def build_sitemap_index(urls, sitemap_url):
+    """
+    <sitemapindex> pointing at one sitemap per SITEMAP_MAX_URLS chunk.
+    
+    Args:
+        sitemap_url (callable): Absolute URL of chunk n (1-based)
+    """
+    parts = []
+    for page, start in enumerate(range(0, len(urls), SITEMAP_MAX_URLS), start=1):
+        chunk = urls[start:start + SITEMAP_MAX_URLS]
+        lastmod = max((m for _loc, m in chunk if m), default=None)
+        lastmod_xml = f"<lastmod>{_w3c_datetime(lastmod)}</lastmod>" if lastmod else ''
+        parts.append(f"<sitemap><loc>{escape(sitemap_url(page))}</loc>{lastmod_xml}</sitemap>")
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        f'{"".join(parts)}</sitemapindex>\n'
+    )
+
+@functools.lru_cache(maxsize=256)
+def _atom_entry_xml(url, title, published, updated, summary):
+    return (
+        f"<entry><id>{escape(url)}</id><title>{escape(title)}</title>"
+        f'<link href="{escape(url)}"/>'
+        f"<published>{_rfc3339(published)}</published><updated>{_rfc3339(updated)}</updated>"
+        f"<summary>{escape(summary)}</summary></entry>"
+    )
+
+def build_atom_feed(posts, feed_url, site_url, post_url):
+    """Atom feed of the newest FEED_SIZE posts."""
+    latest = sorted(posts, key=lambda p: (p.date, p.id), reverse=True)[:FEED_SIZE]
+    updated = newest_lastmod(latest) or '1970-01-01'
+    entries = ''.join(
+        _atom_entry_xml(post_url(p), p.title, p.date, p.lastmod, p.excerpt) for p in latest
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<id>{escape(feed_url)}</id><title>{escape(FEED_TITLE)}</title>"
+        f'<link rel="self" href="{escape(feed_url)}"/><link href="{escape(site_url)}"/>'
+        f"<updated>{_rfc3339(updated)}</updated>"
+        f"<author><name>{escape(FEED_AUTHOR)}</name></author>"
+        f"{entries}</feed>\n"
+    )
+
+@functools.lru_cache(maxsize=256)
+def _rss_item_xml(url, title, published, summary):
+    return (
+        f"<item><title>{escape(title)}</title><link>{escape(url)}</link>"
+        f'<guid isPermaLink="true">{escape(url)}</guid>'
+        f"<pubDate>{format_datetime(_parse_content_datetime(published))}</pubDate>"
+        f"<description>{escape(summary)}</description></item>"
+    )
+
+def build_rss_feed(posts, site_url, post_url):
+    """RSS 2.0 feed of the newest FEED_SIZE posts."""
+    latest = sorted(posts, key=lambda p: (p.date, p.id), reverse=True)[:FEED_SIZE]
+    updated = newest_lastmod(latest)
+    last_build = f"<lastBuildDate>{format_datetime(_parse_content_datetime(updated))}</lastBuildDate>" if updated else ''
+    items = ''.join(_rss_item_xml(post_url(p), p.title, p.date, p.excerpt) for p in latest)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0"><channel>'
+        f"<title>{escape(FEED_TITLE)}</title><link>{escape(site_url)}</link>"
+        f"<description>{escape(FEED_TITLE)}</description>{last_build}"
+        f"{items}</channel></rss>\n"
+    )
+
+# Generated documents keyed by file name (never by request host, which clients control);
+# reused while the same cached content tuples are loaded
+_document_cache = {}
+
+def cached_document(name, sources, build):
+    """
+    Return (body, etag, last_modified) for a generated document, rebuilding
+    only when one of the source tuples (from load_posts/load_projects) changed.
+    """
+    cached = _document_cache.get(name)
+    if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+        return cached[1]
+    body = build()
+    etag = hashlib.sha1(body.encode('utf-8')).hexdigest()
+    last_modified = newest_lastmod([r for source in sources for r in source])
+    last_modified = _parse_content_datetime(last_modified) if last_modified else None
+    _document_cache[name] = (tuple(sources), (body, etag, last_modified))
+    return body, etag, last_modified
+
+# =============================================================================
+# PAGE VIEW COUNTERS
+# =============================================================================
+
+VIEWS_FILE = os.path.join(_PROJECT_ROOT, 'content', 'views.json')
+VIEW_FLUSH_INTERVAL = 30  # seconds between batched writes per worker
+VIEW_TOP_K = 50           # candidates kept for "most read" lists, across all kinds
+
+class CountMinSketch:
+    """
+    Fixed-size approximate counter: memory stays width * depth integers no
+    matter how many distinct keys are counted. Estimates never undercount.
+    """
+    __slots__ = ('width', 'depth', 'table')
+
+    def __init__(self, width=2048, depth=4, table=None):
+        self.width = width
+        self.depth = depth
+        self.table = table if table is not None else array('I', [0]) * (width * depth)
+
+    def _cells(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8 * self.depth).digest()
+        for row in range(self.depth):
+            column = int.from_bytes(digest[8 * row:8 * row + 8], 'little') % self.width
+            yield row * self.width + column
+
+    def add(self, key, count=1):
+        for cell in self._cells(key):
+            self.table[cell] += count
+
+    def estimate(self, key):
+        return min(self.table[cell] for cell in self._cells(key))
+
+    def to_dict(self):
+        return {
+            'width': self.width,
+            'depth': self.depth,
+            'table': base64.b64encode(self.table.tobytes()).decode('ascii')
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        table = array('I')
+        table.frombytes(base64.b64decode(data['table']))
+        return cls(data['width'], data['depth'], table)
+
+
+def _locked_file(path):
+    """Exclusive advisory lock shared by all workers (no-op where fcntl is unavailable)."""
+    if fcntl is None:
+        return contextlib.nullcontext()
+
+    @contextlib.contextmanager
+    def lock():
+        with open(path + '.lock', 'w') as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+    return lock()
+
+
+class ViewCounter:
+    """
+    Per-worker page view counting without I/O on the request path.
+    
+    record() only appends to a deque (atomic under the GIL, so no lock).
+    A background thread loads the current ranking, then drains the deque
+    every flush_interval seconds, merges the batch into the shared on-disk
+    sketch under a file lock, and refreshes an in-memory snapshot of the top
+    keys that popular() reads. Neither method does any I/O itself.
+    """
+
+    def __init__(self, path=VIEWS_FILE, flush_interval=VIEW_FLUSH_INTERVAL, top_k=VIEW_TOP_K):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.top_k = top_k
+        self._pending = collections.deque()
+        self._top = ()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def record(self, kind, ident):
+        """Count one view of e.g. ('post', 3). Starts the flush thread on first use."""
+        self._pending.append(f"{kind}:{ident}")
+        if self._thread is None:
+            self.start()
+
+    def popular(self, kind, limit=5):
+        """
+        [(ident, views)] for the most viewed items of a kind, from memory only.
+        Empty until the background thread has loaded the ranking.
+        """
+        if self._thread is None:
+            self.start()
+        prefix = f"{kind}:"
+        return [(key[len(prefix):], views) for key, views in self._top if key.startswith(prefix)][:limit]
+
+    def start(self):
+        """Start the background thread that loads the ranking and flushes views."""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='view-counter', daemon=True)
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def _run(self):
+        self.load()
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def _load_store(self):
+        try:
+            data = _read_json(self.path)
+            return CountMinSketch.from_dict(data['sketch']), dict(data.get('top', {}))
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+            return CountMinSketch(), {}
+
+    def load(self):
+        """Refresh the top snapshot from disk. No lock: writers swap the file in atomically."""
+        _sketch, top = self._load_store()
+        self._top = tuple(sorted(top.items(), key=lambda item: item[1], reverse=True))
+
+    def flush(self):
+        """Merge pending views into the on-disk store and refresh the top snapshot."""
+        batch = collections.Counter()
+        while True:
+            try:
+                batch[self._pending.popleft()] += 1
+            except IndexError:
+                break
+
+        with _locked_file(self.path):
+            sketch, top = self._load_store()
+            if batch:
+                for key, count in batch.items():
+                    sketch.add(key, count)
+                # Candidates: the previous leaders plus everything touched in this batch
+                for key in set(top) | set(batch):
+                    top[key] = sketch.estimate(key)
+                top = dict(heapq.nlargest(self.top_k, top.items(), key=lambda item: item[1]))
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                _atomic_write_json(self.path, {'sketch': sketch.to_dict(), 'top': top})
+
+        self._top = tuple(sorted(top.items(), key=lambda item: item[1], reverse=True))
+
+# =============================================================================
+# STREAMED RENDERING
+# =============================================================================
+
+STREAM_CHUNK_SIZE = 8 * 1024  # bytes buffered before a chunk is written out
+STREAM_FLUSH_MARKER = '</head>'
+
+def coalesce_chunks(chunks, size=STREAM_CHUNK_SIZE, flush_marker=STREAM_FLUSH_MARKER):
+    """
+    Group Jinja's many small string events into chunks of about `size` bytes.
+    The buffer is flushed as soon as `flush_marker` goes by, so the browser
+    gets the stylesheets and fonts to fetch while the body is still rendering.
+    """
+    buffer = []
+    buffered = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if flush_marker and flush_marker in chunk:
+            flush_marker = None
+        elif buffered < size:
+            continue
+        yield ''.join(buffer)
+        buffer = []
+        buffered = 0
+    if buffer:
+        yield ''.join(buffer)
+
+# =============================================================================
+# ASSET AND LINK CHECKING
+# =============================================================================
+
+_MD_LINK_RE = re.compile(r'(?<!!)\[[^\]]*\]\(\s*<?([^)\s>]+)')
+_TEMPLATE_STATIC_RE = re.compile(r'url_for\(\s*["\']static["\']\s*,\s*filename\s*=\s*["\']([^"\']+)["\']\s*\)')
+_HTML_URL_ATTR_RE = re.compile(r'(?:src|href)=["\'](/[^"\'{}]*)["\']')
+
+# Routes without arguments that shouldn't be crawled by the checker
+LINK_CHECK_SKIP_ENDPOINTS = {'static', 'debug_static', 'logout_page'}
+
+def build_static_index(static_folder=_STATIC_DIR):
+    """
+    Walk the static tree once.
+    
+    Returns:
+        dict: {'files': set of relative paths, 'lower': lowercased path -> actual path}
+    """
+    files = set()
+    for root, _dirs, filenames in os.walk(static_folder):
+        for filename in filenames:
+            rel = os.path.relpath(os.path.join(root, filename), static_folder)
+            files.add(rel.replace(os.sep, '/'))
+    return {'files': files, 'lower': {f.lower(): f for f in files}}
+
+def _clean_url(url):
+    """Strip query string and fragment from a URL."""
+    return url.split('#', 1)[0].split('?', 1)[0]
+
+def collect_content_refs(posts, projects, templates_dir=_TEMPLATES_DIR):
+    """
+    Gather every internal asset and page reference from content and templates.
+    
+    Returns:
+        tuple: (assets, routes) - each a dict of reference -> sorted list of sources
+    """
+    assets = {}
+    routes = {}
+    
+    def add(url, source):
+        url = _clean_url(url)
+        if url.startswith('/static/'):
+            assets.setdefault(url[len('/static/'):], set()).add(source)
+        elif url.startswith('/') and not url.startswith('//'):
+            routes.setdefault(url, set()).add(source)
+    
+    for post in posts:
+        source = f"posts.json#{post.get('id')}"
+        content = post.get('content', '')
+        for url in extract_image_refs(content) + _MD_LINK_RE.findall(content):
+            add(url, source)
+    
+    for project in projects:
+        source = f"projects.json#{project.slug}"
+        for key, value in project.to_dict().items():
+            if isinstance(value, str) and value.startswith('/'):
+                add(value, f"{source}.{key}")
+    
+    # base.html loops over this list, so the filenames aren't literal in the template
+    for stylesheet in SITE_STYLESHEETS:
+        assets.setdefault(stylesheet, set()).add('SITE_STYLESHEETS')
+    
+    for root, _dirs, files in os.walk(templates_dir):
+        for filename in files:
+            if not filename.endswith('.html'):
+                continue
+            path = os.path.join(root, filename)
+            source = os.path.relpath(path, templates_dir).replace(os.sep, '/')
+            with open(path, 'r', encoding='utf-8') as f:
+                html = f.read()
+            for filename_ref in _TEMPLATE_STATIC_RE.findall(html):
+                assets.setdefault(filename_ref, set()).add(source)
+            for url in _HTML_URL_ATTR_RE.findall(html):
+                add(url, source)
+    
+    return (
+        {ref: sorted(sources) for ref, sources in assets.items()},
+        {ref: sorted(sources) for ref, sources in routes.items()}
+    )
+
+def check_asset_refs(asset_refs, static_index):
+    """Validate asset references (relative to static/) against a static index."""
+    results = []
+    for ref, sources in sorted(asset_refs.items()):
+        entry = {'ref': f"/static/{ref}", 'sources': sources, 'status': 'ok'}
+        if ref not in static_index['files']:
+            actual = static_index['lower'].get(ref.lower())
+            if actual:
+                entry['status'] = 'case_mismatch'
+                entry['suggestion'] = f"/static/{actual}"
+            else:
+                entry['status'] = 'missing'
+        results.append(entry)
+    return results
+
+def site_routes(app, posts, projects):
+    """Every public page URL: argument-free GET routes plus one per post and project."""
+    urls = set()
+    for rule in app.url_map.iter_rules():
+        if rule.arguments or rule.endpoint in LINK_CHECK_SKIP_ENDPOINTS:
+            continue
+        if 'GET' in rule.methods:
+            urls.add(rule.rule)
+    urls.update(f"/post/{p['id']}" for p in posts if p.get('published', True))
+    urls.update(f"/projects/{p.slug}" for p in projects)
+    return urls
+
+def _fetch_status(app, path):
+    """
+    GET a path through the WSGI app and read the whole body, so a streamed page
+    that fails after sending its 200 still counts as broken.
+    
+    Returns:
+        tuple: (status code, error message or None)
+    """
+    with app.test_client() as client:
+        response = None
+        try:
+            # The test client already pulls the first chunk while starting the response
+            response = client.get(path, buffered=False)
+            response.get_data()
+        except Exception as e:
+            return 500, f"{type(e).__name__}: {e}"
+        finally:
+            if response is not None:
+                response.close()
+        return response.status_code, None
+
+def check_routes(app, route_refs, workers=8):
+    """
+    Request internal routes concurrently through the WSGI app.
+    
+    Args:
+        route_refs (dict): Path -> list of sources that link to it
+    """
+    paths = sorted(route_refs)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        statuses = list(pool.map(lambda path: _fetch_status(app, path), paths))
+    
+    results = []
+    for path, (code, error) in zip(paths, statuses):
+        result = {
+            'path': path,
+            'sources': route_refs[path],
+            'status_code': code,
+            'status': 'ok' if code < 400 and error is None else 'broken'
+        }
+        if error:
+            result['error'] = error
+        results.append(result)
+    return results
+
+def run_link_check(app, check_pages=True, workers=8):
+    """
+    Check every asset and internal link referenced by posts, projects and templates.
+    
+    Returns:
+        dict: Machine-readable report with 'summary', 'assets' and 'routes'
+    """
+    posts = load_all_posts()
+    projects = load_projects()
+    asset_refs, route_refs = collect_content_refs(posts, projects)
+    
+    assets = check_asset_refs(asset_refs, build_static_index(app.static_folder))
+    
+    routes = []
+    if check_pages:
+        for url in site_routes(app, posts, projects):
+            route_refs.setdefault(url, ['sitemap'])
+        routes = check_routes(app, route_refs, workers=workers)
+    
+    problems = [a for a in assets if a['status'] != 'ok'] + [r for r in routes if r['status'] != 'ok']
+    return {
+        'summary': {
+            'assets_checked': len(assets),
+            'routes_checked': len(routes),
+            'problems': len(problems),
+            'status': 'healthy' if not problems else 'needs_attention'
+        },
+        'assets': assets,
+        'routes': routes
+    }
 
 # =============================================================================
 # FLASK STATIC FILE DEBUGGING UTILITIES
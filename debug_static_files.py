@@ -13,7 +13,7 @@ sys.path.insert(0, app_dir)
 
 # Import Flask app and helper functions
 from app import app
-from helpers import debug_static_configuration, check_common_image_issues, validate_image_path, generate_correct_image_urls
+from helpers import debug_static_configuration, check_common_image_issues, generate_correct_image_urls, run_link_check
 
 def main():
     print("🔍 Flask Static Files Diagnostic Tool")
@@ -40,26 +40,21 @@ def main():
             for rec in issues_report['recommendations']:
                 print(f"  - {rec}")
         
-        # 3. Test specific project images
-        print("\n🖼️ PROJECT IMAGES VALIDATION")
+        # 3. Validate every asset referenced by posts, projects and templates
+        print("\n🖼️ ASSET REFERENCES VALIDATION")
         print("=" * 60)
+        print("(Full report with page checks: python tools/check_links.py --output report.json)")
         
-        # Load projects to test their images
-        from helpers import load_projects
-        projects = load_projects()
-        
-        for project in projects:
-            if 'hero_image' in project:
-                print(f"\nTesting project: {project.get('title', 'Unknown')}")
-                print(f"Image path: {project['hero_image']}")
-                
-                result = validate_image_path(project['hero_image'], app)
-                if result['valid']:
-                    print("✅ Image file exists and is accessible")
-                else:
-                    print("❌ Image file issues:")
-                    for suggestion in result['suggestions']:
-                        print(f"  - {suggestion}")
+        report = run_link_check(app, check_pages=False)
+        broken = [a for a in report['assets'] if a['status'] != 'ok']
+        print(f"Checked {report['summary']['assets_checked']} asset references")
+        if broken:
+            for asset in broken:
+                print(f"❌ {asset['status']}: {asset['ref']} <- {', '.join(asset['sources'])}")
+                if asset.get('suggestion'):
+                    print(f"  - Did you mean {asset['suggestion']}?")
+        else:
+            print("✅ All referenced assets exist")
         
         # 4. Show correct template examples
         print("\n📝 CORRECT TEMPLATE USAGE EXAMPLES")
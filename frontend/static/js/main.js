@@ -11,6 +11,7 @@ class BlogManager {
         this.setupImageUpload();
         this.setupFormHandling();
         this.setupAnimations();
+        this.setupLoadMore();
     }
 
     setupTheme() {
@@ -129,6 +130,78 @@ class BlogManager {
             });
         }
     }
+
+    setupLoadMore() {
+        // Blog listing: the "Load more" link points at the next /blog page; with JS we
+        // fetch that page from /api/posts and append it instead of navigating
+        const loadMoreLink = document.querySelector('[data-load-more]');
+        const postsGrid = document.getElementById('postsGrid');
+        const cardTemplate = postsGrid ? postsGrid.querySelector('[data-post-card]') : null;
+
+        if (!loadMoreLink || !cardTemplate) {
+            return;
+        }
+
+        // Post URLs are rendered with id=0 so the route prefix stays in Flask's hands
+        const postUrl = (id) => loadMoreLink.dataset.postUrl.replace(/0$/, id);
+
+        const renderCard = (post) => {
+            const card = cardTemplate.cloneNode(true);
+            const title = card.querySelector('[data-post-title]');
+            const date = card.querySelector('[data-post-date]');
+            const excerpt = card.querySelector('[data-post-excerpt]');
+            const link = card.querySelector('[data-post-link]');
+
+            title.textContent = post.title;
+            title.href = postUrl(post.id);
+            date.textContent = String(post.date || '').split(' ')[0];
+            excerpt.textContent = post.excerpt;
+            link.href = postUrl(post.id);
+            return card;
+        };
+
+        let loading = false;
+
+        loadMoreLink.addEventListener('click', (event) => {
+            event.preventDefault();
+            if (loading) {
+                return;
+            }
+
+            const params = new URLSearchParams({
+                cursor: loadMoreLink.dataset.cursor,
+                // Same page size as the server-rendered first page
+                limit: loadMoreLink.dataset.limit,
+                fields: 'id,title,date,excerpt'
+            });
+
+            loading = true;
+            loadMoreLink.setAttribute('aria-disabled', 'true');
+            fetch(`${loadMoreLink.dataset.apiUrl}?${params}`)
+                .then(response => response.json())
+                .then(data => {
+                    data.items.forEach(post => postsGrid.appendChild(renderCard(post)));
+
+                    if (data.next_cursor) {
+                        // Keep the link usable for new tabs and no-JS style navigation
+                        const nextPage = new URL(loadMoreLink.href);
+                        nextPage.searchParams.set('cursor', data.next_cursor);
+                        loadMoreLink.href = nextPage;
+                        loadMoreLink.dataset.cursor = data.next_cursor;
+                    } else {
+                        loadMoreLink.remove();
+                    }
+                })
+                .catch(() => {
+                    // Fall back to loading the next page normally
+                    window.location.href = loadMoreLink.href;
+                })
+                .finally(() => {
+                    loading = false;
+                    loadMoreLink.removeAttribute('aria-disabled');
+                });
+        });
+    }
 }
 
 // Initialize when DOM is ready
@@ -0,0 +1,175 @@
+// Navigation, theme toggle and language switcher (shared by every page via base.html)
+
+// MOBILE MENU TOGGLE
+document.addEventListener('DOMContentLoaded', function() {
+    const menuToggle = document.getElementById('menuToggle');
+    const navMenu = document.getElementById('navMenu');
+
+    if (menuToggle && navMenu) {
+        menuToggle.addEventListener('click', function() {
+            const isOpen = navMenu.classList.contains('open');
+            navMenu.classList.toggle('open');
+            menuToggle.setAttribute('aria-expanded', !isOpen);
+        });
+
+        // Close menu when clicking outside
+        document.addEventListener('click', function(e) {
+            if (!menuToggle.contains(e.target) && !navMenu.contains(e.target)) {
+                navMenu.classList.remove('open');
+                menuToggle.setAttribute('aria-expanded', 'false');
+            }
+        });
+    }
+});
+
+// THEME TOGGLE LOGIC
+document.addEventListener('DOMContentLoaded', function() {
+    const themeToggle = document.getElementById('theme-toggle');
+    const themeIcon = document.getElementById('theme-icon');
+    const body = document.body;
+
+    // Set theme function
+    const setTheme = (theme) => {
+        body.setAttribute('data-theme', theme);
+        localStorage.setItem('theme', theme);
+
+        if (themeIcon) {
+            themeIcon.className = theme === 'dark' ? 'fas fa-moon' : 'fas fa-sun';
+        }
+
+        if (themeToggle) {
+            themeToggle.setAttribute('aria-label', 
+                theme === 'dark' ? 'Switch to light mode' : 'Switch to dark mode'
+            );
+        }
+    };
+
+    // Theme toggle event listener
+    if (themeToggle) {
+        themeToggle.addEventListener('click', function() {
+            const currentTheme = body.getAttribute('data-theme') || 'light';
+            const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+            setTheme(newTheme);
+        });
+
+        // Keyboard support for accessibility
+        themeToggle.addEventListener('keydown', function(e) {
+            if (e.key === 'Enter' || e.key === ' ') {
+                e.preventDefault();
+                this.click();
+            }
+        });
+    }
+
+    // Initialize theme on load
+    const savedTheme = localStorage.getItem('theme') || 'light';
+    setTheme(savedTheme);
+});
+
+// LANGUAGE SWITCHER LOGIC
+document.addEventListener('DOMContentLoaded', function() {
+    const langOptions = document.querySelectorAll('.lang-option');
+    const currentLangSpan = document.querySelector('.current-lang');
+
+    // Translation data structure (for future expansion)
+    const translations = {
+        en: {
+            projects: 'Projects',
+            pricing: 'Pricing', 
+            about: 'About',
+            blog: 'Case Studies',
+            contact: 'Contact'
+        },
+        ro: {
+            projects: 'Proiecte',
+            pricing: 'Prețuri',
+            about: 'Despre',
+            blog: 'Studii de Caz',
+            contact: 'Contact'
+        }
+    };
+
+    // Set language function
+    const setLanguage = (langCode) => {
+        // Update current language display
+        if (currentLangSpan) {
+            currentLangSpan.textContent = langCode.toUpperCase();
+        }
+
+        // Update active state
+        langOptions.forEach(option => {
+            option.classList.remove('active');
+            if (option.getAttribute('data-lang') === langCode) {
+                option.classList.add('active');
+            }
+        });
+
+        // Save language preference
+        localStorage.setItem('language', langCode);
+
+        // Update HTML lang attribute
+        document.documentElement.setAttribute('lang', langCode);
+
+        // Future: Update page content based on selected language
+        // This would integrate with your Flask i18n system
+        console.log(`Language switched to: ${langCode}`);
+    };
+
+    // Language option click handlers
+    langOptions.forEach(option => {
+        option.addEventListener('click', function(e) {
+            e.preventDefault();
+            const langCode = this.getAttribute('data-lang');
+            setLanguage(langCode);
+        });
+    });
+
+    // Initialize language on load
+    const savedLanguage = localStorage.getItem('language') || 'en';
+    setLanguage(savedLanguage);
+});
+
+// LANGUAGE SWITCHER DROPDOWN TOGGLE
+(function() {
+    'use strict';
+
+    document.addEventListener('DOMContentLoaded', function() {
+        const langToggle = document.querySelector('.lang-toggle');
+        const languageSwitcher = document.querySelector('.language-switcher');
+
+        if (!langToggle || !languageSwitcher) return;
+
+        // Toggle dropdown on button click
+        langToggle.addEventListener('click', function(e) {
+            e.preventDefault();
+            e.stopPropagation();
+            languageSwitcher.classList.toggle('open');
+        });
+
+        // Close dropdown when clicking outside (but not on language options)
+        document.addEventListener('click', function(e) {
+            // If clicking on a language option, let it navigate
+            if (e.target.closest('.lang-option')) {
+                // Don't interfere with navigation
+                return;
+            }
+
+            // If clicking outside the language switcher, close it
+            if (!languageSwitcher.contains(e.target)) {
+                languageSwitcher.classList.remove('open');
+            }
+        });
+
+        // Ensure language options work properly
+        const langOptions = document.querySelectorAll('.lang-option');
+        langOptions.forEach(function(option) {
+            option.addEventListener('click', function(e) {
+                // Make sure the link navigation happens
+                const href = this.getAttribute('href');
+                if (href) {
+                    window.location.href = href;
+                }
+            });
+        });
+    });
+})();
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Compare time-to-first-byte of buffered and streamed page rendering against a
+generated corpus of posts. Nothing under content/ is touched.
+
+Usage: python tools/bench_streaming.py [--posts 1000 5000] [--runs 20]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from werkzeug.test import EnvironBuilder
+
+# Add the app directory to Python path
+app_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app')
+sys.path.insert(0, app_dir)
+
+import helpers
+from app import app
+
+app.config['TRACK_VIEWS'] = False
+
+PARAGRAPH = (
+    "Cleaning **messy** data is mostly about small, boring rules applied "
+    "consistently. This paragraph stands in for a real case study.\n\n"
+    "```python\nfor row in rows:\n    row['email'] = row['email'].strip().lower()\n```\n\n"
+)
+
+
+def write_corpus(path, count):
+    posts = [{
+        'id': i,
+        'title': f"Benchmark post {i}",
+        'content': PARAGRAPH * (40 if i == 1 else 4),
+        'date': f"20{10 + i % 15:02d}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+        'published': True,
+    } for i in range(1, count + 1)]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(posts, f)
+
+
+def measure(path, cold):
+    """Seconds to the first body chunk and to the last one"""
+    if cold:
+        helpers._content_cache.clear()
+        helpers.render_markdown.cache_clear()
+    environ = EnvironBuilder(path=path).get_environ()
+    started = time.perf_counter()
+    first = None
+    body = app(environ, lambda status, headers, exc_info=None: None)
+    try:
+        for chunk in body:
+            if chunk and first is None:
+                first = time.perf_counter() - started
+    finally:
+        if hasattr(body, 'close'):
+            body.close()
+    return first, time.perf_counter() - started
+
+
+def run(path, streamed, cold, runs):
+    app.config['STREAM_TEMPLATES'] = streamed
+    measure(path, cold)  # warm up templates and code paths
+    samples = [measure(path, cold) for _ in range(runs)]
+    return (statistics.median(s[0] for s in samples) * 1000,
+            statistics.median(s[1] for s in samples) * 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streamed template rendering")
+    parser.add_argument('--posts', type=int, nargs='+', default=[1000, 5000], help="Corpus sizes")
+    parser.add_argument('--runs', type=int, default=20, help="Requests per measurement")
+    args = parser.parse_args()
+
+    original_posts_file = helpers.POSTS_FILE
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            for count in args.posts:
+                helpers.POSTS_FILE = os.path.join(tmp, f"posts-{count}.json")
+                write_corpus(helpers.POSTS_FILE, count)
+                print(f"📊 {count} posts (median of {args.runs}, ms: first byte / full body)")
+                for path in ('/', '/blog', '/post/1'):
+                    for cold in (True, False):
+                        buffered = run(path, False, cold, args.runs)
+                        streamed = run(path, True, cold, args.runs)
+                        label = 'cold' if cold else 'warm'
+                        print(f"  {path:<8} {label}  buffered {buffered[0]:7.1f} / {buffered[1]:7.1f}"
+                              f"   streamed {streamed[0]:7.1f} / {streamed[1]:7.1f}")
+        finally:
+            helpers.POSTS_FILE = original_posts_file
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
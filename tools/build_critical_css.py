@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Generate per-template critical CSS into frontend/static/css/critical/.
+base.html inlines the matching file and loads the full stylesheets async.
+Re-run after editing templates or any stylesheet in SITE_STYLESHEETS.
+
+Usage: python tools/build_critical_css.py
+"""
+
+import os
+import sys
+
+# Add the app directory to Python path
+app_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app')
+sys.path.insert(0, app_dir)
+
+from helpers import build_all_critical_css, CRITICAL_CSS_DIR
+
+if __name__ == '__main__':
+    results = build_all_critical_css()
+    for name, size in results.items():
+        print(f"✓ {name:<32} {size / 1024:6.1f} KB")
+    print(f"Wrote {len(results)} files to {os.path.relpath(CRITICAL_CSS_DIR)}")
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Generate frontend/static/css/highlight.css from the Pygments style used
+for server-side code highlighting. Re-run after changing HIGHLIGHT_STYLE.
+
+Usage: python tools/build_highlight_css.py
+"""
+
+import os
+import sys
+
+# Add the app directory to Python path
+app_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app')
+sys.path.insert(0, app_dir)
+
+from helpers import build_highlight_css, HIGHLIGHT_STYLE
+
+if __name__ == '__main__':
+    path = build_highlight_css()
+    print(f"✓ Wrote {HIGHLIGHT_STYLE} highlight stylesheet to {os.path.relpath(path)}")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Check every image, static asset and internal link referenced by posts,
+projects and templates, and request each internal page through the app.
+
+Usage: python tools/check_links.py [--output report.json] [--workers N] [--no-pages]
+Exits with status 1 when broken references are found.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Add the app directory to Python path
+app_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app')
+sys.path.insert(0, app_dir)
+
+from app import app
+from helpers import run_link_check
+
+# Crawling every page shouldn't inflate the "most read" ranking
+app.config['TRACK_VIEWS'] = False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check static assets and internal links")
+    parser.add_argument('--output', help="Write the JSON report to this file")
+    parser.add_argument('--workers', type=int, default=8, help="Concurrent page requests")
+    parser.add_argument('--no-pages', action='store_true', help="Only check static assets")
+    args = parser.parse_args()
+
+    report = run_link_check(app, check_pages=not args.no_pages, workers=args.workers)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    summary = report['summary']
+    print(f"🔍 Checked {summary['assets_checked']} assets and {summary['routes_checked']} pages")
+    for asset in report['assets']:
+        if asset['status'] != 'ok':
+            hint = f" (did you mean {asset['suggestion']}?)" if asset.get('suggestion') else ''
+            print(f"  ❌ {asset['status']}: {asset['ref']}{hint} <- {', '.join(asset['sources'])}")
+    for route in report['routes']:
+        if route['status'] != 'ok':
+            error = f" ({route['error']})" if route.get('error') else ''
+            print(f"  ❌ {route['status_code']}: {route['path']}{error} <- {', '.join(route['sources'])}")
+
+    if summary['problems']:
+        print(f"❌ {summary['problems']} problem(s) found")
+        return 1
+    print("✅ No broken references")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Bulk import blog posts from a directory of markdown files with front matter.
+
+Each .md file may start with a YAML-style or TOML-style block:
+
+    ---                         +++
+    title: My case study        title = "My case study"
+    date: 2026-01-22            date = "2026-01-22"
+    tags: [python, pandas]      tags = ["python", "pandas"]
+    published: true             published = true
+    ---                         +++
+
+Re-running the import updates posts in place (matched by file path).
+
+Usage: python tools/import_posts.py <directory> [--workers N] [--dry-run]
+"""
+
+import argparse
+import os
+import sys
+
+# Add the app directory to Python path
+app_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app')
+sys.path.insert(0, app_dir)
+
+from helpers import import_markdown_posts
+
+
+def print_progress(done, total):
+    # Redraw at most ~100 times regardless of corpus size
+    if done != total and done % max(1, total // 100):
+        return
+    print(f"\r📄 Parsed {done}/{total} files", end='', flush=True)
+    if done == total:
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import markdown posts into content/posts.json")
+    parser.add_argument('directory', help="Directory tree containing .md files")
+    parser.add_argument('--workers', type=int, default=None, help="Number of worker processes")
+    parser.add_argument('--dry-run', action='store_true', help="Validate without writing posts.json")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.directory):
+        print(f"❌ Not a directory: {args.directory}")
+        return 1
+
+    report = import_markdown_posts(
+        args.directory, workers=args.workers, dry_run=args.dry_run, progress=print_progress
+    )
+
+    if report['errors']:
+        print(f"❌ {len(report['errors'])} file(s) failed validation, nothing was written:")
+        for source, errors in report['errors'].items():
+            for error in errors:
+                print(f"  - {source}.md: {error}")
+        return 1
+
+    prefix = "Would import" if args.dry_run else "Imported"
+    print(f"✅ {prefix}: {report['created']} created, {report['updated']} updated, "
+          f"{report['unchanged']} unchanged")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())